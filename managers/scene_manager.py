@@ -25,6 +25,8 @@ class SceneManager:
         """Set the active scene."""
         if scene_name in self.scenes:
             self.current_scene = self.scenes[scene_name]
+            # The screen still holds the previous scene, so the first frame must be drawn in full
+            self.current_scene.full_redraw = True
 
             # We no longer automatically reset scenes here
             # This allows the game to properly resume from pause
@@ -81,12 +83,16 @@ class SceneManager:
 
             # Render scene section
             performance.start_section("render")
-            self.current_scene.render()
+            dirty_rects = self.current_scene.render()
 
             # Draw performance metrics if enabled
             performance.draw_metrics(pygame.display.get_surface())
 
-            pygame.display.flip()
+            # Scenes that only touched part of the screen hand back their dirty rects
+            if dirty_rects is None or performance.show_metrics:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
             performance.end_section()
 
             # Handle scene transition
@@ -40,26 +40,28 @@ class ScoreManager:
         # Update high score if needed
         if self.current_score > self.high_score:
             self.high_score = self.current_score
-            logger.info(f"New high score: {self.high_score}")
+            logger.info("New high score: %d", self.high_score)
 
-        logger.debug(f"Added {points_to_add} points to score (multiplier: {self.score_multiplier})")
+        logger.debug(
+            "Added %d points to score (multiplier: %s)", points_to_add, self.score_multiplier
+        )
 
     def enemy_defeated(self):
         """Add points for defeating an enemy."""
         self.add_score(self.ENEMY_DEFEAT_POINTS)
-        logger.debug(f"Enemy defeated: +{self.ENEMY_DEFEAT_POINTS} points")
+        logger.debug("Enemy defeated: +%d points", self.ENEMY_DEFEAT_POINTS)
 
     def powerup_collected(self):
         """Add points for collecting a powerup."""
         self.add_score(self.POWERUP_COLLECTED_POINTS)
-        logger.debug(f"Powerup collected: +{self.POWERUP_COLLECTED_POINTS} points")
+        logger.debug("Powerup collected: +%d points", self.POWERUP_COLLECTED_POINTS)
 
     def add_time_survived_points(self, seconds):
         """Add points based on time survived and update multiplier if necessary."""
         # Add points for time survived
         points = seconds * self.POINTS_PER_SECOND
         self.add_score(points)
-        logger.debug(f"Time survived: +{points} points for {seconds} seconds")
+        logger.debug("Time survived: +%s points for %s seconds", points, seconds)
 
         # Update total time survived
         self.total_time_survived += seconds
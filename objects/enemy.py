@@ -18,6 +18,9 @@ class Enemy(pygame.sprite.Sprite):
     TYPE_RANGED = "ranged"
     TYPE_CHARGER = "charger"
 
+    # Fallback color for each enemy type when the config does not set one
+    _DEFAULT_COLORS = {TYPE_BASIC: "purple", TYPE_RANGED: "red", TYPE_CHARGER: "yellow"}
+
     def __init__(self, position, enemy_type=TYPE_BASIC):
         super().__init__()
         # Assign a unique ID to each enemy
@@ -31,15 +34,13 @@ class Enemy(pygame.sprite.Sprite):
         self.width = config.get("enemy", "dimensions", "width", default=30)
         self.height = config.get("enemy", "dimensions", "height", default=30)
 
-        # Map enemy types to colors
-        color_map = {
-            self.TYPE_BASIC: config.get("enemy", "appearance", "basic", "color", default="purple"),
-            self.TYPE_RANGED: config.get("enemy", "appearance", "ranged", "color", default="red"),
-            self.TYPE_CHARGER: config.get(
-                "enemy", "appearance", "charger", "color", default="yellow"
-            ),
-        }
-        self.color = color_map.get(enemy_type, "purple")
+        # Only the color for this enemy's own type is looked up
+        default_color = self._DEFAULT_COLORS.get(enemy_type)
+        self.color = (
+            config.get("enemy", "appearance", enemy_type, "color", default=default_color)
+            if default_color is not None
+            else "purple"
+        )
 
         # Load character sprite
         self.image = game_asset_manager.get_character_sprite(self.color, self.width, self.height)
@@ -80,6 +81,15 @@ class Enemy(pygame.sprite.Sprite):
         self.flash_duration = config.get("enemy", "effects", "flash_duration", default=200)
         self.flash_color = (255, 0, 0)  # Red by default
 
+        # Cache currency drop settings from config
+        self.currency_min_drop = config.get("player", "upgrades", "currency", "min_drop", default=1)
+        self.currency_max_drop = config.get(
+            "player", "upgrades", "currency", "max_drop", default=10
+        )
+        self.currency_drop_chance = config.get(
+            "player", "upgrades", "currency", "drop_chance", default=1.0
+        )
+
         logger.debug(f"Enemy {self.id} of type {self.enemy_type} created at {position}")
 
     def can_collide(self, current_time: int) -> bool:
@@ -100,9 +110,11 @@ class Enemy(pygame.sprite.Sprite):
             Distance to target
         """
         # Calculate direction to target
-        dx = target_position[0] - self.position[0]
-        dy = target_position[1] - self.position[1]
-        distance = math.sqrt(dx**2 + dy**2)
+        position = self.position
+        pos_x, pos_y = position
+        dx = target_position[0] - pos_x
+        dy = target_position[1] - pos_y
+        distance = math.hypot(dx, dy)
 
         if distance > 0:
             # Normalize direction vector
@@ -113,25 +125,29 @@ class Enemy(pygame.sprite.Sprite):
             separation_dx, separation_dy = 0, 0
 
             if nearby_enemies:
+                separation_radius = self.separation_radius
+                separation_radius_sq = separation_radius * separation_radius
                 for enemy in nearby_enemies:
-                    if enemy.id != self.id:  # Don't avoid self
-                        # Calculate vector from other enemy to this enemy
-                        sep_dx = self.position[0] - enemy.position[0]
-                        sep_dy = self.position[1] - enemy.position[1]
-                        sep_dist = math.sqrt(sep_dx**2 + sep_dy**2)
-
-                        # Only apply separation if within radius
-                        if 0 < sep_dist < self.separation_radius:
-                            # The closer they are, the stronger the separation
-                            separation_factor = 1.0 - (sep_dist / self.separation_radius)
-
-                            # Normalize and weight by how close they are
-                            if sep_dist > 0:  # Avoid division by zero
-                                separation_dx += (sep_dx / sep_dist) * separation_factor
-                                separation_dy += (sep_dy / sep_dist) * separation_factor
+                    if enemy is self:  # Don't avoid self
+                        continue
+                    # Calculate vector from other enemy to this enemy
+                    other_position = enemy.position
+                    sep_dx = pos_x - other_position[0]
+                    sep_dy = pos_y - other_position[1]
+
+                    # Only apply separation if within radius; compare squared to skip most sqrts
+                    sep_dist_sq = sep_dx * sep_dx + sep_dy * sep_dy
+                    if 0 < sep_dist_sq < separation_radius_sq:
+                        sep_dist = math.sqrt(sep_dist_sq)
+                        # The closer they are, the stronger the separation
+                        separation_factor = 1.0 - (sep_dist / separation_radius)
+
+                        # Normalize and weight by how close they are
+                        separation_dx += (sep_dx / sep_dist) * separation_factor
+                        separation_dy += (sep_dy / sep_dist) * separation_factor
 
             # Normalize separation vector if it's not zero
-            sep_magnitude = math.sqrt(separation_dx**2 + separation_dy**2)
+            sep_magnitude = math.hypot(separation_dx, separation_dy)
             if sep_magnitude > 0:
                 separation_dx /= sep_magnitude
                 separation_dy /= sep_magnitude
@@ -145,7 +161,7 @@ class Enemy(pygame.sprite.Sprite):
             )
 
             # Normalize the combined vector
-            combined_magnitude = math.sqrt(combined_dx**2 + combined_dy**2)
+            combined_magnitude = math.hypot(combined_dx, combined_dy)
             if combined_magnitude > 0:
                 combined_dx /= combined_magnitude
                 combined_dy /= combined_magnitude
@@ -155,12 +171,12 @@ class Enemy(pygame.sprite.Sprite):
             combined_dy += (random.random() * 2 - 1) * self.position_jitter
 
             # Apply speed
-            self.position[0] += combined_dx * self.speed
-            self.position[1] += combined_dy * self.speed
+            speed = self.speed
+            position[0] = pos_x = pos_x + combined_dx * speed
+            position[1] = pos_y = pos_y + combined_dy * speed
 
             # Update rect position
-            self.rect.x = round(self.position[0])
-            self.rect.y = round(self.position[1])
+            self.rect.topleft = (round(pos_x), round(pos_y))
 
         return distance
 
@@ -175,13 +191,18 @@ class Enemy(pygame.sprite.Sprite):
         """Update enemy state."""
         if player_position:
             self.move_towards(player_position, enemy_group)
-        self.apply_visual_effects()
+        self.apply_visual_effects(current_time)
 
-    def apply_visual_effects(self):
-        """Apply visual effects like flashing to the sprite."""
+    def apply_visual_effects(self, current_time=None):
+        """Apply visual effects like flashing to the sprite.
+
+        Args:
+            current_time: Current time in milliseconds; fetched if not provided
+        """
         update_mask = False
         if self.flash_effect:
-            current_time = pygame.time.get_ticks()
+            if current_time is None:
+                current_time = pygame.time.get_ticks()
             if current_time - self.flash_timer > self.flash_duration:
                 self.flash_effect = False
                 self.image = self.original_image.copy()
@@ -229,15 +250,10 @@ class Enemy(pygame.sprite.Sprite):
 
     def drop_currency(self):
         """Drop currency when enemy is defeated."""
-        # Get currency settings from config
-        min_drop = config.get("player", "upgrades", "currency", "min_drop", default=1)
-        max_drop = config.get("player", "upgrades", "currency", "max_drop", default=10)
-        drop_chance = config.get("player", "upgrades", "currency", "drop_chance", default=1.0)
-
         # Check if currency should be dropped based on chance
-        if random.random() <= drop_chance:
+        if random.random() <= self.currency_drop_chance:
             # Calculate random amount between min and max
-            amount = random.randint(min_drop, max_drop)
+            amount = random.randint(self.currency_min_drop, self.currency_max_drop)
 
             # Add currency to the player's total
             currency_manager = CurrencyManager()
@@ -288,7 +304,7 @@ class RangedEnemy(Enemy):
         if current_time - self.last_shot_time > self.attack_cooldown:
             self.shoot_at_player(player_position, projectile_group, all_sprites)
             self.last_shot_time = current_time
-        super().apply_visual_effects()
+        super().apply_visual_effects(current_time)
 
     def shoot_at_player(self, player_position, projectile_group, all_sprites):
         """Shoot a projectile at the player."""
@@ -304,7 +320,7 @@ class RangedEnemy(Enemy):
         )
         map_width = getattr(self, "map_width", None)
         map_height = getattr(self, "map_height", None)
-        projectile = Projectile(
+        projectile = Projectile.acquire(
             start_pos,
             velocity,
             damage=self.projectile_damage,
@@ -360,7 +376,7 @@ class ChargerEnemy(Enemy):
                 self.position[1] += self.charge_direction[1] * self.speed
                 self.rect.x = round(self.position[0])
                 self.rect.y = round(self.position[1])
-                super().apply_visual_effects()
+                super().apply_visual_effects(current_time)
                 return
         dx = player_position[0] - self.position[0]
         dy = player_position[1] - self.position[1]
@@ -372,7 +388,7 @@ class ChargerEnemy(Enemy):
             self.start_charge(player_position, current_time)
         else:
             super().move_towards(player_position, enemy_group)
-        super().apply_visual_effects()
+        super().apply_visual_effects(current_time)
 
     def start_charge(self, player_position, current_time: int):
         """Initiate a charge towards the player."""
@@ -393,6 +409,10 @@ class ChargerEnemy(Enemy):
         logger.debug(f"Charger Enemy {self.id} ended charge attack")
 
 
+# Enemy class for each type that has its own subclass
+_ENEMY_CLASSES = {Enemy.TYPE_RANGED: RangedEnemy, Enemy.TYPE_CHARGER: ChargerEnemy}
+
+
 def create_enemy(position, enemy_type=None, attr_multipliers=None):
     """
     Factory function to create an enemy instance.
@@ -418,13 +438,8 @@ def create_enemy(position, enemy_type=None, attr_multipliers=None):
         )
         enemy_type = random.choices(list(weights.keys()), list(weights.values()), k=1)[0]
 
-    # Create the enemy based on type
-    if enemy_type == Enemy.TYPE_RANGED:
-        enemy = RangedEnemy(position)
-    elif enemy_type == Enemy.TYPE_CHARGER:
-        enemy = ChargerEnemy(position)
-    else:
-        enemy = Enemy(position)
+    # Create the enemy based on type; unknown types fall back to a basic enemy
+    enemy = _ENEMY_CLASSES.get(enemy_type, Enemy)(position)
 
     # Apply attribute multipliers
     health_multiplier = attr_multipliers.get("health", 1.0)
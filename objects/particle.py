@@ -37,11 +37,11 @@ class Particle(pygame.sprite.Sprite):
         self.image = pygame.Surface((size, size), pygame.SRCALPHA)
         pygame.draw.circle(self.image, color, (size // 2, size // 2), size // 2)
         self.rect = self.image.get_rect(center=(int(position[0]), int(position[1])))
-        self.mask = pygame.mask.from_surface(self.image)
 
-    def update(self):
+    def update(self, current_time=None):
         """Update particle position, velocity, and appearance."""
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         time_alive = current_time - self.born_time
         if time_alive >= self.lifetime:
             self.kill()
@@ -116,15 +116,28 @@ class ParticleSystem:
                 },
             ),
         }
+        # Resolve each type's color names to RGB tuples once
+        self._particle_colors = {
+            particle_type: [config.get_color(color_name) for color_name in type_config["colors"]]
+            for particle_type, type_config in self.particle_configs.items()
+        }
         logger.debug(f"Particle system initialized. Enabled: {self.enabled}")
 
+    def __len__(self):
+        """Return the number of live particles."""
+        return len(self.particles)
+
     def set_camera_offset(self, offset: tuple[int, int]):
         """Set the current camera offset for proper positioning."""
         self.camera_offset = offset
 
     def create_particles(self, position: tuple[float, float], particle_type: str):
         """Create a burst of particles at the specified position."""
-        if not self.enabled:
+        self.create_particles_batch((position,), particle_type)
+
+    def create_particles_batch(self, positions, particle_type: str):
+        """Create a burst of particles of the same type at each of the given positions."""
+        if not self.enabled or not positions:
             return
 
         # Use cached configuration
@@ -134,41 +147,53 @@ class ParticleSystem:
         max_speed = particle_config["max_speed"]
         min_lifetime = particle_config["min_lifetime"]
         max_lifetime = particle_config["max_lifetime"]
-        color_names = particle_config["colors"]
         size_range = particle_config["size_range"]
         gravity = particle_config["gravity"]
         fade_out = particle_config["fade_out"]
 
-        colors = [config.get_color(color_name) for color_name in color_names]
-
-        for _ in range(count):
-            color = random.choice(colors)
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(min_speed, max_speed)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed
-            lifetime = random.randint(min_lifetime, max_lifetime)
-            size = random.randint(size_range[0], size_range[1])
-            particle = Particle(
-                position, (velocity_x, velocity_y), color, size, lifetime, gravity, fade_out
-            )
-            self.particles.add(particle)
+        colors = self._particle_colors.get(particle_type, self._particle_colors["hit"])
+
+        new_particles = []
+        for position in positions:
+            for _ in range(count):
+                color = random.choice(colors)
+                angle = random.uniform(0, 2 * math.pi)
+                speed = random.uniform(min_speed, max_speed)
+                velocity_x = math.cos(angle) * speed
+                velocity_y = math.sin(angle) * speed
+                lifetime = random.randint(min_lifetime, max_lifetime)
+                size = random.randint(size_range[0], size_range[1])
+                new_particles.append(
+                    Particle(
+                        position,
+                        (velocity_x, velocity_y),
+                        color,
+                        size,
+                        lifetime,
+                        gravity,
+                        fade_out,
+                    )
+                )
+        self.particles.add(new_particles)
 
     def update(self):
         """Update all particles."""
-        self.particles.update()
+        # One clock read per frame is shared by every particle
+        current_time = pygame.time.get_ticks()
+        for particle in self.particles.sprites():
+            particle.update(current_time)
 
     def draw(self, surface: pygame.Surface):
         """Draw all particles to the surface with camera offset applied."""
-        for particle in self.particles:
-            original_center = particle.rect.center
-            particle.rect.center = (
-                int(particle.position[0] + self.camera_offset[0]),
-                int(particle.position[1] + self.camera_offset[1]),
-            )
-        self.particles.draw(surface)
-        for particle in self.particles:
-            particle.rect.center = original_center
+        particles = self.particles.sprites()
+        if not particles:
+            return
+        offset_x, offset_y = self.camera_offset
+        # Shifted copies of the rects leave the particles' own rects in world space
+        surface.blits(
+            [(particle.image, particle.rect.move(offset_x, offset_y)) for particle in particles],
+            doreturn=False,
+        )
 
     def clear(self):
         """Remove all particles."""
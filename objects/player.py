@@ -151,12 +151,17 @@ class Player(pygame.sprite.Sprite):
             self.base_damage += damage_increase
             logger.info(f"Applied damage upgrade: +{damage_increase} damage (Level {damage_level})")
 
-    def apply_visual_effects(self):
-        """Apply visual effects like flashing to the player sprite."""
+    def apply_visual_effects(self, current_time=None):
+        """Apply visual effects like flashing to the player sprite.
+
+        Args:
+            current_time: Current time in milliseconds; fetched if not provided
+        """
         update_mask = False
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
 
         if self.flash_effect:
-            current_time = pygame.time.get_ticks()
             if current_time - self.flash_timer > self.flash_duration:
                 self.flash_effect = False
                 self.image = self.original_image.copy()
@@ -175,7 +180,6 @@ class Player(pygame.sprite.Sprite):
                 update_mask = True
 
         elif self.invincible:
-            current_time = pygame.time.get_ticks()
             if (current_time // 100) % 2 == 0:
                 self.image.set_alpha(100)
             else:
@@ -186,8 +190,15 @@ class Player(pygame.sprite.Sprite):
         if update_mask:
             self.mask = pygame.mask.from_surface(self.image)
 
-    def update(self):
-        """Update player state including movement, shooting, and effects."""
+    def update(self, current_time=None):
+        """Update player state including movement, shooting, and effects.
+
+        Args:
+            current_time: Current time in milliseconds, so the caller's frame timestamp
+                can be shared; fetched if not provided
+        """
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         keys = pygame.key.get_pressed()
         moving = False
         if keys[pygame.K_LEFT]:
@@ -206,7 +217,6 @@ class Player(pygame.sprite.Sprite):
         if self.map_width and self.map_height:
             self.rect.clamp_ip((0, 0, self.map_width, self.map_height))
 
-        current_time = pygame.time.get_ticks()
         time_since_last_shot = current_time - self.last_shot_time
 
         if self.shot_cooldown < 100:
@@ -214,7 +224,7 @@ class Player(pygame.sprite.Sprite):
             self.shot_cooldown = self.base_shot_cooldown
 
         if moving and time_since_last_shot >= self.shot_cooldown:
-            projectile = self.shoot()
+            projectile = self.shoot(current_time)
             if projectile:
                 logger.debug(f"Projectile created with ID: {projectile.id}")
                 logger.debug(f"Projectile velocity: {projectile.velocity}")
@@ -242,10 +252,11 @@ class Player(pygame.sprite.Sprite):
             if current_time - self.weapon_boost_timer > self.weapon_boost_duration:
                 self.deactivate_weapon_boost()
 
-        self.apply_visual_effects()
+        self.apply_visual_effects(current_time)
 
-    def shoot(self):
-        current_time = pygame.time.get_ticks()
+    def shoot(self, current_time=None):
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         time_since_last_shot = current_time - self.last_shot_time
         if time_since_last_shot < self.shot_cooldown:
             return None
@@ -267,7 +278,7 @@ class Player(pygame.sprite.Sprite):
                     base_damage = self.base_damage * self.damage_boost_factor
                     damage = base_damage * damage_multiplier
 
-                    projectile = Projectile(
+                    projectile = Projectile.acquire(
                         self.rect.center,
                         velocity,
                         damage=damage,
@@ -1,3 +1,4 @@
+import itertools
 import pygame
 import math
 from utils.logger import GameLogger
@@ -9,7 +10,8 @@ logger = GameLogger.get_logger("powerup")
 class Powerup(pygame.sprite.Sprite):
     """A class representing a powerup that can be collected by the player."""
 
-    next_id = 1
+    # Counter for unique powerup IDs
+    _id_counter = itertools.count(1)
 
     def __init__(self, position: tuple[int, int], powerup_type: str):
         """Initialize a powerup at the given position with the specified type.
@@ -20,8 +22,7 @@ class Powerup(pygame.sprite.Sprite):
         """
         super().__init__()
 
-        self.id = Powerup.next_id
-        Powerup.next_id += 1
+        self.id = next(Powerup._id_counter)
 
         self.type = powerup_type
         self.active = True
@@ -39,7 +40,9 @@ class Powerup(pygame.sprite.Sprite):
         self._create_image()
         self.rect = self.image.get_rect(center=position)
 
-        logger.debug(f"Powerup {self.id} of type {powerup_type} created at position {position}")
+        logger.debug(
+            "Powerup %d of type %s created at position %s", self.id, powerup_type, position
+        )
 
     def _create_image(self):
         """Create the powerup image with the current pulse size."""
@@ -166,14 +169,19 @@ class Powerup(pygame.sprite.Sprite):
     def deactivate(self):
         """Deactivate the powerup, making it unavailable for collection."""
         self.active = False
-        logger.debug(f"Powerup {self.id} deactivated")
+        logger.debug("Powerup %d deactivated", self.id)
 
-    def update(self):
-        """Update the powerup state each frame."""
-        current_time = pygame.time.get_ticks()
+    def update(self, current_time=None):
+        """Update the powerup state each frame.
+
+        Args:
+            current_time: Current time in milliseconds; fetched if not provided
+        """
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
 
         if current_time - self.creation_time > self.lifespan:
-            logger.debug(f"Powerup {self.id} expired")
+            logger.debug("Powerup %d expired", self.id)
             self.kill()
             return
 
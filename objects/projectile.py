@@ -1,3 +1,4 @@
+import itertools
 import pygame
 from managers import config
 from utils.logger import GameLogger
@@ -8,7 +9,22 @@ logger = GameLogger.get_logger("projectile")
 
 class Projectile(pygame.sprite.Sprite):
     # Counter for unique projectile IDs
-    next_id = 1
+    _id_counter = itertools.count(1)
+
+    # Config values shared by every projectile, read once so firing makes no config lookups
+    WIDTH = config.get("projectile", "dimensions", "width", default=10)
+    HEIGHT = config.get("projectile", "dimensions", "height", default=10)
+    DEFAULT_DAMAGE = config.get("projectile", "attributes", "damage", default=10)
+    OFF_SCREEN_MARGIN = config.get("projectile", "off_screen_margin", default=100)
+    DEFAULT_MAP_WIDTH = config.get("screen", "width", default=800)
+    DEFAULT_MAP_HEIGHT = config.get("screen", "height", default=600)
+    PLAYER_COLOR = config.get_color("white")
+    ENEMY_COLOR = config.get_color("red")
+    CRIT_COLOR = config.get_color("gold")
+
+    # Killed projectiles kept for reuse so steady fire does not allocate a sprite per shot
+    _pool = []
+    _POOL_LIMIT = 256
 
     def __init__(
         self,
@@ -21,75 +37,126 @@ class Projectile(pygame.sprite.Sprite):
         is_crit: bool = False,
     ):
         super().__init__()
+        self.image = None
+        self.reset(position, velocity, damage, is_enemy_projectile, map_width, map_height, is_crit)
+
+    @classmethod
+    def acquire(
+        cls,
+        position: tuple[float, float],
+        velocity: tuple[float, float],
+        damage: int = None,
+        is_enemy_projectile: bool = False,
+        map_width: int = None,
+        map_height: int = None,
+        is_crit: bool = False,
+    ) -> "Projectile":
+        """Return a projectile from the pool, or a new one if the pool is empty."""
+        if cls._pool:
+            projectile = cls._pool.pop()
+            projectile.reset(
+                position, velocity, damage, is_enemy_projectile, map_width, map_height, is_crit
+            )
+            return projectile
+        return cls(position, velocity, damage, is_enemy_projectile, map_width, map_height, is_crit)
+
+    @classmethod
+    def clear_pool(cls):
+        """Drop all pooled projectiles, e.g. when a game session ends."""
+        cls._pool.clear()
+
+    def reset(
+        self,
+        position: tuple[float, float],
+        velocity: tuple[float, float],
+        damage: int = None,
+        is_enemy_projectile: bool = False,
+        map_width: int = None,
+        map_height: int = None,
+        is_crit: bool = False,
+    ):
+        """(Re)initialize the projectile, reusing its image surface when the size is unchanged."""
         # Assign a unique ID to each projectile
-        self.id = Projectile.next_id
-        Projectile.next_id += 1
+        self.id = next(Projectile._id_counter)
 
-        # Cache projectile dimensions from config
-        self.width = config.get("projectile", "dimensions", "width", default=10)
-        self.height = config.get("projectile", "dimensions", "height", default=10)
+        # Projectile dimensions
+        self.width = Projectile.WIDTH
+        self.height = Projectile.HEIGHT
 
-        # Create projectile image
-        self.image = pygame.Surface((self.width, self.height))
+        # Create projectile image; a new surface also invalidates any cached collision mask
+        if self.image is None or self.image.get_size() != (self.width, self.height):
+            self.image = pygame.Surface((self.width, self.height))
+            self.mask = None
 
-        # Cache color based on projectile type
+        # Color based on projectile type
         if is_crit:
-            self.color = config.get_color("gold")
+            self.color = Projectile.CRIT_COLOR
         else:
-            self.color = (
-                config.get_color("red") if is_enemy_projectile else config.get_color("white")
-            )
+            self.color = Projectile.ENEMY_COLOR if is_enemy_projectile else Projectile.PLAYER_COLOR
         self.image.fill(self.color)
 
         # Set initial position and velocity
         self.rect = self.image.get_rect(center=position)
-        self.position = list(position)
         self.velocity = velocity
+        # Plain float attributes are cheaper to update each frame than list items
+        self._px = float(position[0])
+        self._py = float(position[1])
+        self._vx = float(velocity[0])
+        self._vy = float(velocity[1])
         self.is_enemy_projectile = is_enemy_projectile
 
-        # Cache damage from config if not provided
-        self.damage = (
-            damage
-            if damage is not None
-            else config.get("projectile", "attributes", "damage", default=10)
-        )
+        # Default damage if not provided
+        self.damage = damage if damage is not None else Projectile.DEFAULT_DAMAGE
 
-        # Cache map dimensions for boundary checking
-        self.map_width = map_width or config.get("screen", "width", default=800)
-        self.map_height = map_height or config.get("screen", "height", default=600)
+        # Map dimensions for boundary checking
+        self.map_width = map_width or Projectile.DEFAULT_MAP_WIDTH
+        self.map_height = map_height or Projectile.DEFAULT_MAP_HEIGHT
+        self.off_screen_margin = Projectile.OFF_SCREEN_MARGIN
 
-        # Cache off-screen margin
-        self.off_screen_margin = config.get("projectile", "off_screen_margin", default=100)
+        # Region the projectile may travel in before it is removed
+        self._bounds = pygame.Rect(
+            -self.off_screen_margin,
+            -self.off_screen_margin,
+            self.map_width + 2 * self.off_screen_margin,
+            self.map_height + 2 * self.off_screen_margin,
+        )
 
         self.active = True
         logger.debug(
-            f"Projectile {self.id} created at {position} with velocity {velocity} (enemy: {is_enemy_projectile})"
+            "Projectile %d created at %s with velocity %s (enemy: %s)",
+            self.id,
+            position,
+            velocity,
+            is_enemy_projectile,
         )
 
+    @property
+    def position(self) -> tuple[float, float]:
+        """The projectile's precise (float) position."""
+        return (self._px, self._py)
+
     def update(self):
         """Update the projectile position based on velocity and check boundaries."""
-        self.position[0] += self.velocity[0]
-        self.position[1] += self.velocity[1]
-        self.rect.center = (int(self.position[0]), int(self.position[1]))
+        self._px += self._vx
+        self._py += self._vy
+        self.rect.center = (int(self._px), int(self._py))
 
         # Check if projectile is off-map with a margin
-        margin = self.off_screen_margin
-        if (
-            self.rect.right < -margin
-            or self.rect.left > self.map_width + margin
-            or self.rect.bottom < -margin
-            or self.rect.top > self.map_height + margin
-        ):
+        if not self._bounds.colliderect(self.rect):
             self.kill()
-            logger.debug(f"Projectile {self.id} went far off-map and was removed")
+            logger.debug("Projectile %d went far off-map and was removed", self.id)
 
     def deactivate(self):
         """Deactivate the projectile."""
         self.active = False
-        logger.debug(f"Projectile {self.id} deactivated")
+        logger.debug("Projectile %d deactivated", self.id)
 
     def kill(self):
         """Override kill method to set active to False before removing from groups."""
+        was_active = self.active
         self.active = False
         super().kill()
-        logger.debug(f"Projectile {self.id} killed")
+        # Only the first kill returns the projectile to the pool
+        if was_active and len(Projectile._pool) < Projectile._POOL_LIMIT:
+            Projectile._pool.append(self)
+        logger.debug("Projectile %d killed", self.id)
@@ -1,11 +1,35 @@
+import bisect
 import pygame
 from .scene import Scene
 from managers import config, game_asset_manager
 from utils.logger import GameLogger
+from utils.performance import performance
 
 # Get a logger for the game over scene
 logger = GameLogger.get_logger("game_over")
 
+# Font size tables: (ascending pixel thresholds, size names). A font size at or above
+# thresholds[i] maps to names[i + 1]; anything below the first threshold maps to names[0].
+_BUTTON_FONT_SIZES = ((22, 26, 30, 36), ("small", "ui", "normal", "heading", "title"))
+_TITLE_FONT_SIZES = ((36,), ("heading", "title"))
+# Stats use a smaller font than buttons of the same size to avoid overlap
+_STATS_FONT_SIZES = ((24, 28), ("small", "ui", "normal"))
+
+
+def _size_name(font_size, table):
+    """Map a numeric font size to the closest pre-defined size name using a size table."""
+    thresholds, names = table
+    return names[bisect.bisect_right(thresholds, font_size)]
+
+
+def _scale_ui(surface, size):
+    """Smooth-scale a UI surface where its bit depth allows, converted for fast blitting."""
+    if surface.get_bitsize() in (24, 32):
+        scaled = pygame.transform.smoothscale(surface, size)
+    else:
+        scaled = pygame.transform.scale(surface, size)
+    return scaled.convert_alpha()
+
 
 class GameOverScene(Scene):
     """Game over scene displayed when the player dies."""
@@ -20,18 +44,21 @@ class GameOverScene(Scene):
         self.powerups_collected = 0
         self.time_survived = 0
 
-        # Menu options
-        self.menu_options = [
-            {"text": "Restart", "action": "game"},
-            {"text": "Upgrades", "action": "upgrades"},
-            {"text": "Main Menu", "action": "main_menu"},
-            {"text": "Exit", "action": "exit"},
-        ]
+        # Menu options, stored as parallel label/action tuples
+        self._menu_texts = ("Restart", "Upgrades", "Main Menu", "Exit")
+        self._menu_actions = ("game", "upgrades", "main_menu", "exit")
+        self._num_options = len(self._menu_texts)
+        self._action_dispatch = {
+            action: getattr(self, f"_do_{action}") for action in self._menu_actions
+        }
         self.selected_option = 0
+        self._prev_selection_rect = None
+        self._current_selection_rect = None
 
         # UI theme from config
         self.ui_theme = config.get("ui", "default_theme", default="blue")
-        self.load_ui_assets()
+        # UI assets are loaded the first time the scene is shown, not at game startup
+        self._loaded = False
 
         self.play_scene_music("game_over")
 
@@ -52,90 +79,127 @@ class GameOverScene(Scene):
         self.screen_width = config.get("screen", "width", default=800)
         self.screen_height = config.get("screen", "height", default=600)
 
+        # Fetch the game over config subtree once instead of walking "ui" -> "game_over" per key
+        game_over_cfg = config.get("ui", "game_over", default={})
+        panel_cfg = game_over_cfg.get("panel", {})
+        buttons_cfg = game_over_cfg.get("buttons", {})
+        title_cfg = game_over_cfg.get("title", {})
+        stats_cfg = game_over_cfg.get("stats", {})
+
         # Get panel dimensions from config
-        panel_width_ratio = config.get("ui", "game_over", "panel", "width_ratio", default=0.6)
-        panel_height_ratio = config.get("ui", "game_over", "panel", "height_ratio", default=0.75)
+        panel_width_ratio = panel_cfg.get("width_ratio", 0.6)
+        panel_height_ratio = panel_cfg.get("height_ratio", 0.75)
         panel_width = int(self.screen_width * panel_width_ratio)
         panel_height = int(self.screen_height * panel_height_ratio)
 
-        # Scale the panel to fit our needs
-        self.panel = pygame.transform.scale(self.panel, (panel_width, panel_height))
-
-        # Calculate panel position
-        self.panel_rect = self.panel.get_rect(
-            center=(self.screen_width // 2, self.screen_height // 2)
-        )
-
         # Get button configuration from config
-        button_width_ratio = config.get("ui", "game_over", "buttons", "width_ratio", default=0.7)
-        button_height = config.get("ui", "game_over", "buttons", "height", default=50)
-        button_spacing = config.get("ui", "game_over", "buttons", "spacing", default=70)
+        button_width_ratio = buttons_cfg.get("width_ratio", 0.7)
+        button_height = buttons_cfg.get("height", 50)
+        button_spacing = buttons_cfg.get("spacing", 70)
 
         # Scale buttons to fit within the panel based on config
         button_width = int(panel_width * button_width_ratio)
 
-        # Create scaled buttons
-        self.scaled_button_normal = pygame.transform.scale(
-            self.button_normal, (button_width, button_height)
-        )
-        self.scaled_button_hover = pygame.transform.scale(
-            self.button_hover, (button_width, button_height)
-        )
+        # Scale the panel and buttons
+        self.panel = _scale_ui(self.panel, (panel_width, panel_height))
+        self.scaled_button_normal = _scale_ui(self.button_normal, (button_width, button_height))
+        self.scaled_button_hover = _scale_ui(self.button_hover, (button_width, button_height))
 
-        # Calculate button positions - position them at the bottom of the panel with good spacing
-        self.button_rects = []
+        # Calculate panel position
+        self.panel_rect = self.panel.get_rect(
+            center=(self.screen_width // 2, self.screen_height // 2)
+        )
 
         # Calculate where the buttons should start (from bottom of panel, leave some space)
-        total_button_height = len(self.menu_options) * button_height + (
-            len(self.menu_options) - 1
-        ) * (button_spacing - button_height)
+        total_button_height = self._num_options * button_height + (self._num_options - 1) * (
+            button_spacing - button_height
+        )
         button_start_y = (
             self.panel_rect.bottom - total_button_height - 30
         )  # 30px padding from bottom
 
-        for i in range(len(self.menu_options)):
-            button_rect = self.scaled_button_normal.get_rect(
-                center=(self.panel_rect.centerx, button_start_y + i * button_spacing)
-            )
-            self.button_rects.append(button_rect)
-
         # Load button font based on config
-        button_font_size = config.get("ui", "game_over", "buttons", "font_size", default=24)
-
-        # Map numeric font size to closest pre-defined size name
-        if button_font_size >= 36:
-            size_name = "title"
-        elif button_font_size >= 30:
-            size_name = "heading"
-        elif button_font_size >= 26:
-            size_name = "normal"
-        elif button_font_size >= 22:
-            size_name = "ui"
-        else:
-            size_name = "small"
-
-        self.button_font = game_asset_manager.get_font("default", size_name)
+        button_font_size = buttons_cfg.get("font_size", 24)
+        self.button_font = game_asset_manager.get_font(
+            "default", _size_name(button_font_size, _BUTTON_FONT_SIZES)
+        )
 
         # Load title font
-        title_font_size = config.get("ui", "game_over", "title", "font_size", default=48)
-        title_size_name = "title" if title_font_size >= 36 else "heading"
-        self.game_over_title_font = game_asset_manager.get_font("default", title_size_name)
+        title_font_size = title_cfg.get("font_size", 48)
+        self.game_over_title_font = game_asset_manager.get_font(
+            "default", _size_name(title_font_size, _TITLE_FONT_SIZES)
+        )
 
         # Load stats font - use smaller font for stats to avoid overlap
-        stats_font_size = config.get("ui", "game_over", "stats", "font_size", default=18)
-        stats_size_name = "small"
-        if stats_font_size >= 28:
-            stats_size_name = "normal"
-        elif stats_font_size >= 24:
-            stats_size_name = "ui"
+        stats_font_size = stats_cfg.get("font_size", 18)
+        self.stats_font = game_asset_manager.get_font(
+            "default", _size_name(stats_font_size, _STATS_FONT_SIZES)
+        )
+
+        # Resolve colors once; they never change while the scene is alive
+        self._bg_color = config.get_color(game_over_cfg.get("background_color", "black"))
+        self._title_color = config.get_color(title_cfg.get("color", "red"))
+        self._score_color = config.get_color(stats_cfg.get("score_color", "yellow"))
+        self._high_score_color = config.get_color("orange")
+        self._stats_color = config.get_color(stats_cfg.get("text_color", "white"))
+        self._button_text_color = config.get_color(buttons_cfg.get("text_color", "white"))
+
+        self._center_x = self.screen_width // 2
+
+        # Title and button labels never change, so render them once
+        self._title_surf = self.game_over_title_font.render("GAME OVER", True, self._title_color)
+        self._title_rect = self._title_surf.get_rect(
+            center=(self._center_x, self.panel_rect.top + 60)
+        )
+
+        # Lay out the buttons at the bottom of the panel and render their labels in one pass,
+        # keeping (button_rect, text_surf, text_rect) together for rendering
+        self.button_rects = []
+        self._buttons = []
+        for i, option_text in enumerate(self._menu_texts):
+            button_rect = self.scaled_button_normal.get_rect(
+                center=(self.panel_rect.centerx, button_start_y + i * button_spacing)
+            )
+            text = self.button_font.render(option_text, True, self._button_text_color)
+            self.button_rects.append(button_rect)
+            self._buttons.append((button_rect, text, text.get_rect(center=button_rect.center)))
+
+        # Buttons are stacked in an evenly spaced column, so hit tests can pick a single
+        # candidate from the y offset once the point is inside the column's bounding box
+        self._buttons_bbox = self.button_rects[0].unionall(self.button_rects[1:])
+        self._button_spacing = button_spacing
+        # Buttons taller than the spacing overlap the slots below them; that many earlier
+        # buttons must be checked first so the topmost match still wins
+        self._button_overlap = max(0, -(-button_height // button_spacing) - 1)
+
+        # Everything but the selected button is composed onto this surface once the final
+        # stats are known, so redraws are a single blit
+        self._stats_key = None
+        self._static_bg = None
+
+        # Stat line positions - spread evenly between the title and the first button
+        available_space = self.button_rects[0].top - (
+            self._title_rect.bottom + 20
+        )  # Space between title and first button
+        num_stat_lines = 5  # Score, high score, and 3 stat lines
+        line_spacing = available_space / (num_stat_lines + 1)  # +1 for extra padding
+        self._stats_y_positions = [
+            self._title_rect.bottom + (i + 1) * line_spacing for i in range(num_stat_lines)
+        ]
 
-        self.stats_font = game_asset_manager.get_font("default", stats_size_name)
+        self._loaded = True
+        logger.debug(f"Game over UI assets loaded with {self._num_options} buttons")
 
-        logger.debug(f"Game over UI assets loaded with {len(self.button_rects)} buttons")
+    def _ensure_ui_loaded(self):
+        """Load the UI assets if they haven't been loaded yet."""
+        if not self._loaded:
+            self.load_ui_assets()
 
     def reset(self):
         """Reset the scene state."""
+        self._ensure_ui_loaded()
         self.selected_option = 0
+        self.full_redraw = True
 
         # Get stats from the game scene
         if self.scene_manager:
@@ -152,12 +216,13 @@ class GameOverScene(Scene):
 
     def handle_event(self, event):
         """Handle menu navigation and selection."""
+        self._ensure_ui_loaded()
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
-                self.selected_option = (self.selected_option - 1) % len(self.menu_options)
+                self.selected_option = (self.selected_option - 1) % self._num_options
                 self.play_sound("menu_navigate")
             elif event.key == pygame.K_DOWN:
-                self.selected_option = (self.selected_option + 1) % len(self.menu_options)
+                self.selected_option = (self.selected_option + 1) % self._num_options
                 self.play_sound("menu_navigate")
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                 self.select_current_option()
@@ -165,133 +230,147 @@ class GameOverScene(Scene):
         # Handle mouse events
         elif event.type == pygame.MOUSEMOTION:
             # Check if mouse is over any button
-            mouse_pos = pygame.mouse.get_pos()
-            for i, rect in enumerate(self.button_rects):
-                if rect.collidepoint(mouse_pos):
-                    if self.selected_option != i:
-                        self.selected_option = i
-                        self.play_sound("menu_navigate")
-                    break
+            index = self._button_at(event.pos)
+            if index is not None and self.selected_option != index:
+                self.selected_option = index
+                self.play_sound("menu_navigate")
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left mouse button
-                mouse_pos = pygame.mouse.get_pos()
-                for i, rect in enumerate(self.button_rects):
-                    if rect.collidepoint(mouse_pos):
-                        self.selected_option = i
-                        self.select_current_option()
-                        break
+                index = self._button_at(event.pos)
+                if index is not None:
+                    self.selected_option = index
+                    self.select_current_option()
+
+    def _button_at(self, pos):
+        """Return the index of the button under pos, or None if there isn't one."""
+        if not self._buttons_bbox.collidepoint(pos):
+            return None
+        index = (pos[1] - self._buttons_bbox.top) // self._button_spacing
+        for i in range(max(0, index - self._button_overlap), min(index + 1, self._num_options)):
+            if self.button_rects[i].collidepoint(pos):
+                return i
+        return None
 
     def select_current_option(self):
         """Execute the action for the currently selected option."""
         self.play_sound("button_click")
-        action = self.menu_options[self.selected_option]["action"]
-        if action == "exit":
-            self.done = True
-        else:
-            # Make sure game is reset if starting a new game
-            if action == "game" and self.scene_manager:
-                game_scene = self.scene_manager.scenes.get("game")
-                if game_scene:
-                    # Always reset the game when starting from game over
-                    game_scene.reset()
-                    # Ensure the game isn't paused
-                    game_scene.paused = False
-
-            elif action == "upgrades" and self.scene_manager:
-                # Set the previous scene to return to game over menu
-                upgrades_scene = self.scene_manager.scenes.get("upgrades")
-                if upgrades_scene:
-                    upgrades_scene.set_previous_scene("game_over")
-
-            self.switch_to_scene(action)
+        self._action_dispatch[self._menu_actions[self.selected_option]]()
+
+    def _do_exit(self):
+        """Quit the game."""
+        self.done = True
+
+    def _do_game(self):
+        """Start a new game."""
+        # Make sure game is reset if starting a new game
+        if self.scene_manager:
+            game_scene = self.scene_manager.scenes.get("game")
+            if game_scene:
+                # Always reset the game when starting from game over
+                game_scene.reset()
+                # Ensure the game isn't paused
+                game_scene.paused = False
+        self.switch_to_scene("game")
+
+    def _do_upgrades(self):
+        """Open the upgrade menu, returning to the game over screen afterwards."""
+        if self.scene_manager:
+            # Set the previous scene to return to game over menu
+            upgrades_scene = self.scene_manager.scenes.get("upgrades")
+            if upgrades_scene:
+                upgrades_scene.set_previous_scene("game_over")
+        self.switch_to_scene("upgrades")
+
+    def _do_main_menu(self):
+        """Return to the main menu."""
+        self.switch_to_scene("main_menu")
 
     def update(self):
         """Update menu logic. Nothing needed for a simple menu."""
         pass
 
     def render(self):
-        """Render the game over screen."""
-        # Set background color
-        background_color = config.get("ui", "game_over", "background_color", default="black")
-        self.screen.fill(config.get_color(background_color))
+        """Render the game over screen.
+
+        The whole screen is only drawn when the scene is entered; afterwards just the
+        previously and currently selected buttons are redrawn.
+
+        Returns:
+            List of dirty rects to update, or None after a full redraw.
+        """
+        self._ensure_ui_loaded()
+        self._current_selection_rect = self.button_rects[self.selected_option]
+
+        if self.full_redraw or performance.show_metrics:
+            self._update_static_background()
+            self.screen.blit(self._static_bg, (0, 0))
+            self._render_selected_button()
+            # Keep redrawing in full while the metrics overlay is drawn on top of us
+            self.full_redraw = performance.show_metrics
+            self._prev_selection_rect = self._current_selection_rect
+            return None
+
+        if self._current_selection_rect == self._prev_selection_rect:
+            return []
+
+        # Restore the normal button under the old selection, then draw the new one
+        self.screen.blit(self._static_bg, self._prev_selection_rect, self._prev_selection_rect)
+        self._render_selected_button()
+
+        # Update the two button rects separately; their union would also cover every
+        # button in between
+        dirty_rects = [self._prev_selection_rect, self._current_selection_rect]
+        self._prev_selection_rect = self._current_selection_rect
+        return dirty_rects
+
+    def _update_static_background(self):
+        """Rebuild the static background if the stats changed since it was last composed."""
+        stats_key = (
+            self.final_score,
+            self.high_score,
+            self.enemies_killed,
+            self.powerups_collected,
+            self.time_survived,
+        )
+        if stats_key == self._stats_key:
+            return
+        self._stats_key = stats_key
 
-        # Draw the panel background
-        self.screen.blit(self.panel, self.panel_rect)
+        background = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        background.fill(self._bg_color)
 
-        # Get title configuration
-        title_color = config.get("ui", "game_over", "title", "color", default="red")
+        # Draw the panel background
+        background.blit(self.panel, self.panel_rect)
 
         # Draw title - position at the top of the panel with good spacing
-        title = self.game_over_title_font.render("GAME OVER", True, config.get_color(title_color))
-        title_rect = title.get_rect(center=(self.screen_width // 2, self.panel_rect.top + 60))
-        self.screen.blit(title, title_rect)
+        background.blit(self._title_surf, self._title_rect)
 
-        # Draw score and stats - calculate spacing to fit between title and buttons
-        available_space = self.button_rects[0].top - (
-            title_rect.bottom + 20
-        )  # Space between title and first button
-
-        # Divide the available space evenly
-        num_stat_lines = 5  # Score, high score, and 3 stat lines
-        line_spacing = available_space / (num_stat_lines + 1)  # +1 for extra padding
-
-        # Start position for stats (after title with some padding)
-        y_position = title_rect.bottom + line_spacing
-
-        # Score display
-        score_color = config.get("ui", "game_over", "stats", "score_color", default="yellow")
-        score_text = self.stats_font.render(
-            f"SCORE: {self.final_score:,}", True, config.get_color(score_color)
-        )
-        score_rect = score_text.get_rect(center=(self.screen_width // 2, y_position))
-        self.screen.blit(score_text, score_rect)
-
-        # High score display
-        y_position += line_spacing
         high_score_color = (
-            config.get_color(score_color)
-            if self.final_score >= self.high_score
-            else config.get_color("orange")
+            self._score_color if self.final_score >= self.high_score else self._high_score_color
         )
-        high_score_text = self.stats_font.render(
-            f"HIGH SCORE: {self.high_score:,}", True, high_score_color
-        )
-        high_score_rect = high_score_text.get_rect(center=(self.screen_width // 2, y_position))
-        self.screen.blit(high_score_text, high_score_rect)
-
-        # Stats display
-        y_position += line_spacing
-        stats = [
-            f"ENEMIES DEFEATED: {self.enemies_killed}",
-            f"POWERUPS COLLECTED: {self.powerups_collected}",
-            f"TIME SURVIVED: {self.time_survived} SECONDS",
+        lines = [
+            (f"SCORE: {self.final_score:,}", self._score_color),
+            (f"HIGH SCORE: {self.high_score:,}", high_score_color),
+            (f"ENEMIES DEFEATED: {self.enemies_killed}", self._stats_color),
+            (f"POWERUPS COLLECTED: {self.powerups_collected}", self._stats_color),
+            (f"TIME SURVIVED: {self.time_survived} SECONDS", self._stats_color),
         ]
 
-        stats_color = config.get("ui", "game_over", "stats", "text_color", default="white")
-        for stat in stats:
-            stat_text = self.stats_font.render(stat, True, config.get_color(stats_color))
-            stat_rect = stat_text.get_rect(center=(self.screen_width // 2, y_position))
-            self.screen.blit(stat_text, stat_rect)
-            y_position += line_spacing
-
-        # Get button text color from config
-        button_text_color = config.get("ui", "game_over", "buttons", "text_color", default="white")
-
-        # Draw menu options as buttons
-        for i, option in enumerate(self.menu_options):
-            # Choose button image based on selection
-            button_img = (
-                self.scaled_button_hover if i == self.selected_option else self.scaled_button_normal
-            )
+        # Draw score and stats
+        for (text, color), y_position in zip(lines, self._stats_y_positions):
+            stat_surf = self.stats_font.render(text, True, color)
+            background.blit(stat_surf, stat_surf.get_rect(center=(self._center_x, y_position)))
 
-            # Draw the button
-            button_rect = self.button_rects[i]
-            self.screen.blit(button_img, button_rect)
+        # Draw every menu button in its normal state; the selection is drawn on top
+        for button_rect, text, text_rect in self._buttons:
+            background.blit(self.scaled_button_normal, button_rect)
+            background.blit(text, text_rect)
 
-            # Draw the button text
-            text = self.button_font.render(
-                option["text"], True, config.get_color(button_text_color)
-            )
-            text_rect = text.get_rect(center=button_rect.center)
-            self.screen.blit(text, text_rect)
+        self._static_bg = background
+
+    def _render_selected_button(self):
+        """Draw the hover image and label for the currently selected button."""
+        button_rect, text, text_rect = self._buttons[self.selected_option]
+        self.screen.blit(self.scaled_button_hover, button_rect)
+        self.screen.blit(text, text_rect)
@@ -2,7 +2,7 @@ import pygame
 import random
 import math
 from .scene import Scene
-from objects import Player, Enemy, Powerup, ParticleSystem
+from objects import Player, Enemy, Powerup, Projectile, ParticleSystem
 from objects.enemy import create_enemy
 from utils import (
     CollisionSystem,
@@ -12,6 +12,7 @@ from utils import (
     handle_player_powerup_collision,
 )
 from utils.camera import Camera
+from utils.collision_handler import SpatialHashGrid
 from utils.tiledmap import TiledMapRenderer
 from managers import config, game_state, ScoreManager, game_asset_manager
 from managers.game_state_manager import GameState
@@ -20,6 +21,23 @@ from utils.logger import GameLogger
 
 logger = GameLogger.get_logger("game_scene")
 
+# Maximum number of rendered HUD text surfaces kept by GameScene.draw_text
+_TEXT_CACHE_LIMIT = 256
+
+# Powerup types an enemy can drop, chosen uniformly
+_POWERUP_TYPES = ("health", "shield", "weapon", "speed", "damage")
+
+# Distance in pixels between HUD elements and the screen edges
+_HUD_MARGIN = 10
+
+# Enemy spawn positions just outside each map edge, indexed by edge: (width, height, margin)
+_SPAWN_EDGES = (
+    lambda w, h, m: (random.randint(0, w), -m),  # Top
+    lambda w, h, m: (random.randint(0, w), h + m),  # Bottom
+    lambda w, h, m: (-m, random.randint(0, h)),  # Left
+    lambda w, h, m: (w + m, random.randint(0, h)),  # Right
+)
+
 
 class GameScene(Scene):
     """Main gameplay scene managing game objects, rendering, and state."""
@@ -27,6 +45,9 @@ class GameScene(Scene):
     def __init__(self):
         super().__init__()
         logger.info("Initializing GameScene")
+        # HUD fonts by size and rendered HUD text by (text, size, color); see draw_text
+        self._font_cache = {}
+        self._text_cache = {}
         self._initialize_game()
         self.play_scene_music("game")
 
@@ -37,6 +58,9 @@ class GameScene(Scene):
         self.particle_system = ParticleSystem()
         self.all_sprites = pygame.sprite.Group(self.player)
         self.enemy_group = pygame.sprite.Group()
+        # Enemies are also split by type so the update loop doesn't branch per enemy
+        self.ranged_enemies = pygame.sprite.Group()
+        self.melee_enemies = pygame.sprite.Group()
         self.projectile_group = pygame.sprite.Group()
         self.powerup_group = pygame.sprite.Group()
 
@@ -50,13 +74,16 @@ class GameScene(Scene):
         self.currency_manager = self.player.currency_manager
 
         # Timing and state variables
-        self.last_spawn_time = pygame.time.get_ticks()
         self.paused = False
         self.score_manager = ScoreManager()
-        self.last_time_score_update = pygame.time.get_ticks()
+        self.start_time = pygame.time.get_ticks()
+        # Tick of the most recent update(), shared with render() for consistent frame timing
+        self._now = self.start_time
+        self.last_time_score_update = self.start_time
         self.enemies_killed = 0
         self.time_survived = 0
-        self.start_time = pygame.time.get_ticks()
+        # time_survived only changes once a second; this is the tick of the next change
+        self._next_survival_tick = self.start_time + 1000
         self.powerups_collected = 0
 
         # Spawn rate scaling variables
@@ -70,19 +97,32 @@ class GameScene(Scene):
         self.spawn_rate_increase_interval = config.get(
             "mechanics", "enemy_spawn", "scaling_interval", default=30000
         )  # Time in ms between difficulty increases
-        self.last_spawn_rate_increase = pygame.time.get_ticks()
+        self.last_spawn_rate_increase = self.start_time
         self.current_spawn_interval = self.base_spawn_interval
         self.difficulty_level = 1
 
+        # Settings read on hot paths are looked up once here rather than every frame
+        self.screen_width = config.get("screen", "width", default=800)
+        self.screen_height = config.get("screen", "height", default=600)
+        self.background_color = pygame.Color(
+            config.get("screen", "background_color", default="#222222")
+        )
+        self.spawn_margin = config.get("mechanics", "enemy_spawn", "margin", default=30)
+        self.screen_shake_duration = config.get("effects", "screen_shake", "duration", default=300)
+        self.screen_shake_intensity = config.get("effects", "screen_shake", "intensity", default=15)
+        self.powerup_drop_chance = config.get("powerups", "drop_chance", default=0.25)
+
         # Collision system setup
-        screen_width = config.get("screen", "width", default=800)
-        screen_height = config.get("screen", "height", default=600)
         self.collision_system = CollisionSystem(
-            screen_width=screen_width,
-            screen_height=screen_height,
+            screen_width=self.screen_width,
+            screen_height=self.screen_height,
             algorithm=CollisionSystem.SPATIAL_HASH,
             cell_size=64,
         )
+        # Enemies hashed by position so each one only considers nearby enemies for separation
+        self._separation_grid = SpatialHashGrid(self.screen_width, self.screen_height, 64)
+        separation_radius = config.get("enemy", "behavior", "separation_radius", default=60)
+        self._separation_reach = 2 * separation_radius
 
         # Load map and set initial state
         self._load_map()
@@ -109,6 +149,30 @@ class GameScene(Scene):
             "ui", "health_bar", "fill_color", default=(255, 0, 0)
         )
         self.health_bar_border = config.get("ui", "health_bar", "border_color", default=(0, 0, 0))
+        # The bar's background and border never change, so draw them onto surfaces once
+        self._health_bar_bg = pygame.Surface((self.health_bar_width, self.health_bar_height))
+        self._health_bar_bg.fill(self.health_bar_background)
+        self._health_bar_frame = pygame.Surface(
+            (self.health_bar_width, self.health_bar_height), pygame.SRCALPHA
+        )
+        pygame.draw.rect(
+            self._health_bar_frame,
+            self.health_bar_border,
+            (0, 0, self.health_bar_width, self.health_bar_height),
+            2,
+        )
+        self.currency_name = config.get("player", "upgrades", "currency", "name", default="Souls")
+
+        # HUD layout - fixed once the screen and health bar sizes are known
+        self._health_bar_pos = (_HUD_MARGIN, _HUD_MARGIN)
+        self._health_text_pos = (
+            _HUD_MARGIN + self.health_bar_width + _HUD_MARGIN,
+            _HUD_MARGIN + self.health_bar_height // 2,
+        )
+        self._currency_text_pos = (_HUD_MARGIN, _HUD_MARGIN + self.health_bar_height + _HUD_MARGIN)
+        self._score_text_x = self.screen_width - _HUD_MARGIN
+        self._hud_center_x = self.screen_width // 2
+        self._hud_center_y = self.screen_height // 2
 
     def _load_map(self):
         """Load tiled map and configure camera, with fallback if loading fails."""
@@ -117,10 +181,11 @@ class GameScene(Scene):
             tiled_map = game_asset_manager.load_tiled_map("Tiled/sampleMap.tmx")
             if tiled_map:
                 self.map_renderer = TiledMapRenderer(tiled_map)
-                screen_width = config.get("screen", "width", default=800)
-                screen_height = config.get("screen", "height", default=600)
                 self.camera = Camera(
-                    self.map_renderer.width, self.map_renderer.height, screen_width, screen_height
+                    self.map_renderer.width,
+                    self.map_renderer.height,
+                    self.screen_width,
+                    self.screen_height,
                 )
                 self.map_width = self.map_renderer.width
                 self.map_height = self.map_renderer.height
@@ -137,8 +202,8 @@ class GameScene(Scene):
         """Configure fallback background when map loading fails."""
         self.map_renderer = None
         self.camera = None
-        self.map_width = config.get("screen", "width", default=800)
-        self.map_height = config.get("screen", "height", default=600)
+        self.map_width = self.screen_width
+        self.map_height = self.screen_height
         self.player.map_width = self.map_width
         self.player.map_height = self.map_height
         logger.info(f"Fallback background set: {self.map_width}x{self.map_height}")
@@ -163,28 +228,18 @@ class GameScene(Scene):
             enemy_type: Type of enemy to spawn ('basic', 'ranged', 'charger')
             attr_multipliers: Dictionary of attribute multipliers (health, damage, speed)
         """
-        current_time = pygame.time.get_ticks()
         map_width = self.map_width
         map_height = self.map_height
-        margin = config.get("mechanics", "enemy_spawn", "margin", default=30)
-
-        edge = random.randint(0, 3)
-        if edge == 0:  # Top
-            position = (random.randint(0, map_width), -margin)
-        elif edge == 1:  # Bottom
-            position = (random.randint(0, map_width), map_height + margin)
-        elif edge == 2:  # Left
-            position = (-margin, random.randint(0, map_height))
-        else:  # Right
-            position = (map_width + margin, random.randint(0, map_height))
+        margin = self.spawn_margin
+
+        # Pick one of the four map edges (two random bits) and a point along it
+        position = _SPAWN_EDGES[random.getrandbits(2)](map_width, map_height, margin)
 
         # Create the enemy with the specified type and attribute multipliers
         enemy = create_enemy(position, enemy_type, attr_multipliers)
         enemy.map_width = map_width
         enemy.map_height = map_height
-        self.enemy_group.add(enemy)
-        self.all_sprites.add(enemy)
-        self.last_spawn_time = current_time
+        self._add_enemy(enemy)
         logger.debug(
             f"{enemy.enemy_type.capitalize()} enemy spawned at {position} with multipliers: {attr_multipliers}"
         )
@@ -192,8 +247,16 @@ class GameScene(Scene):
         # Add points for spawning an enemy (for testing)
         self.score_manager.add_score(1)
 
+    def _add_enemy(self, enemy):
+        """Add an enemy to the scene's sprite groups, including its per-type group."""
+        if enemy.enemy_type == Enemy.TYPE_RANGED:
+            self.ranged_enemies.add(enemy)
+        else:
+            self.melee_enemies.add(enemy)
+        self.enemy_group.add(enemy)
+        self.all_sprites.add(enemy)
+
     def spawn_boss(self, attr_multipliers=None):
-        current_time = pygame.time.get_ticks()
         map_width = self.map_width
         map_height = self.map_height
 
@@ -219,9 +282,7 @@ class GameScene(Scene):
         enemy.rect = enemy.image.get_rect(center=enemy.rect.center)
 
         # Add enemy to groups
-        self.enemy_group.add(enemy)
-        self.all_sprites.add(enemy)
-        self.last_spawn_time = current_time
+        self._add_enemy(enemy)
 
         logger.info(f"Boss spawned at {position} with multipliers: {attr_multipliers}")
         self.score_manager.add_score(50)
@@ -232,8 +293,7 @@ class GameScene(Scene):
         if self.paused:
             return
 
-        current_time = pygame.time.get_ticks()
-        keys = pygame.key.get_pressed()
+        self._now = current_time = pygame.time.get_ticks()
 
         # Update difficulty based on time played
         self._update_difficulty(current_time)
@@ -276,40 +336,47 @@ class GameScene(Scene):
                 # Play wave complete sound
                 self.play_sound("wave_complete")
 
-        # Update game objects
-        num_projectiles = len(self.projectile_group)
-        self.player.update()
-        if len(self.projectile_group) > num_projectiles and random.random() < 0.3:
+        # Update game objects - groups used repeatedly below are bound to locals once
+        player = self.player
+        projectile_group = self.projectile_group
+        enemy_group = self.enemy_group
+        powerup_group = self.powerup_group
+
+        num_projectiles = len(projectile_group)
+        player.update(current_time)
+        if len(projectile_group) > num_projectiles and random.random() < 0.3:
             self.play_sound("player_hit")
 
         if self.camera:
-            self.camera.update(self.player)
-        for enemy in self.enemy_group:
-            if hasattr(enemy, "enemy_type") and enemy.enemy_type == Enemy.TYPE_RANGED:
-                enemy.update(
-                    self.player.rect.center,
-                    current_time,
-                    self.projectile_group,
-                    self.all_sprites,
-                    self.enemy_group,
-                )
-            else:
-                enemy.update(self.player.rect.center, current_time, None, None, self.enemy_group)
-        self.projectile_group.update()
-        self.powerup_group.update()
-        self.particle_system.update()
-
-        # Collision and cleanup
-        self.collision_system.update(
-            self.projectile_group, self.enemy_group, self.player, self.powerup_group
-        )
-        self._handle_collisions()
-        for enemy in self.enemy_group.copy():
-            if not enemy.alive():
-                self.handle_enemy_death(enemy)
+            self.camera.update(player)
+        # The player has finished moving for this frame
+        player_center = player.rect.center
+        all_sprites = self.all_sprites
+        separation_grid = self._separation_grid
+        separation_grid.sync(enemy_group)
+        reach = self._separation_reach
+        for enemy in self.ranged_enemies:
+            nearby = separation_grid.query(enemy.rect.inflate(reach, reach))
+            enemy.update(player_center, current_time, projectile_group, all_sprites, nearby)
+        for enemy in self.melee_enemies:
+            nearby = separation_grid.query(enemy.rect.inflate(reach, reach))
+            enemy.update(player_center, current_time, None, None, nearby)
+        projectile_group.update()
+        powerup_group.update(current_time)
+        # Quiet frames have no particles to age
+        if len(self.particle_system):
+            self.particle_system.update()
+
+        # Collision and cleanup - the player alone has nothing to collide with
+        if projectile_group or enemy_group or powerup_group:
+            self.collision_system.update(projectile_group, enemy_group, player, powerup_group)
+            # Enemy deaths are handled in _handle_collisions; killed sprites leave their groups
+            self._handle_collisions()
 
         # Update scoring and time
-        self.time_survived = (current_time - self.start_time) // 1000
+        if current_time >= self._next_survival_tick:
+            self.time_survived = (current_time - self.start_time) // 1000
+            self._next_survival_tick = self.start_time + (self.time_survived + 1) * 1000
         if current_time - self.last_time_score_update >= 5000:
             seconds = (current_time - self.last_time_score_update) // 1000
             self.score_manager.add_time_survived_points(seconds)
@@ -356,52 +423,43 @@ class GameScene(Scene):
 
     def _render_ui(self):
         """Draw UI elements like health bar, score, and wave information."""
-        # Get display dimensions
-        display_width, display_height = self.screen.get_size()
-
         # --- Health Bar ---
-        health_bar_width = self.health_bar_width
-        health_bar_height = self.health_bar_height
+        health_bar_x, health_bar_y = self._health_bar_pos
         health_ratio = self.player.current_health / self.player.max_health
         # Background
-        pygame.draw.rect(
-            self.screen, self.health_bar_background, (10, 10, health_bar_width, health_bar_height)
-        )
+        self.screen.blit(self._health_bar_bg, self._health_bar_pos)
         # Foreground (health)
         pygame.draw.rect(
             self.screen,
             self.health_bar_foreground,
-            (10, 10, int(health_bar_width * health_ratio), health_bar_height),
+            (
+                health_bar_x,
+                health_bar_y,
+                int(self.health_bar_width * health_ratio),
+                self.health_bar_height,
+            ),
         )
         # Border
-        pygame.draw.rect(
-            self.screen, self.health_bar_border, (10, 10, health_bar_width, health_bar_height), 2
-        )
+        self.screen.blit(self._health_bar_frame, self._health_bar_pos)
 
         # Health text
         health_text = f"Health: {int(self.player.current_health)}/{self.player.max_health}"
-        self.draw_text(
-            health_text,
-            24,
-            (255, 255, 255),
-            10 + health_bar_width + 10,
-            10 + health_bar_height // 2,
-        )
+        self.draw_text(health_text, 24, (255, 255, 255), *self._health_text_pos)
 
         # --- Currency Display ---
-        currency_name = config.get("player", "upgrades", "currency", "name", default="Souls")
-        currency_text = f"{currency_name}: {self.currency_manager.get_currency()}"
+        currency_text = f"{self.currency_name}: {self.currency_manager.get_currency()}"
         self.draw_text(
             currency_text,
             20,
             (255, 215, 0),  # Gold color
-            10,
-            10 + health_bar_height + 10,
+            *self._currency_text_pos,
         )
 
         # --- Score ---
         score_text = f"Score: {self.score_manager.current_score}"
-        self.draw_text(score_text, 24, (255, 255, 255), display_width - 10, 10, align="right")
+        self.draw_text(
+            score_text, 24, (255, 255, 255), self._score_text_x, _HUD_MARGIN, align="right"
+        )
 
         # --- Wave Information ---
         self._render_wave_info()
@@ -409,7 +467,7 @@ class GameScene(Scene):
         # Wave transition message
         if self.wave_transition_timer:
             # Calculate fade-in/fade-out alpha
-            elapsed = pygame.time.get_ticks() - self.wave_transition_timer
+            elapsed = self._now - self.wave_transition_timer
             if elapsed < self.wave_transition_duration / 2:
                 # Fade in
                 alpha = int(255 * (elapsed / (self.wave_transition_duration / 2)))
@@ -433,8 +491,8 @@ class GameScene(Scene):
                 self.wave_transition_text,
                 size,
                 (0, 0, 0),
-                display_width // 2 + 2,
-                display_height // 2 + 2,
+                self._hud_center_x + 2,
+                self._hud_center_y + 2,
                 align="center",
                 alpha=alpha,
             )
@@ -442,8 +500,8 @@ class GameScene(Scene):
                 self.wave_transition_text,
                 size,
                 (255, 255, 0),
-                display_width // 2,
-                display_height // 2,
+                self._hud_center_x,
+                self._hud_center_y,
                 align="center",
                 alpha=alpha,
             )
@@ -462,17 +520,14 @@ class GameScene(Scene):
                     next_wave_text,
                     28,
                     color,
-                    display_width // 2,
-                    display_height // 2 + 50,
+                    self._hud_center_x,
+                    self._hud_center_y + 50,
                     align="center",
                     alpha=alpha,
                 )
 
     def _render_wave_info(self):
         """Render wave information UI elements including wave number and enemies remaining."""
-        # Get display dimensions
-        display_width, display_height = self.screen.get_size()
-
         # Wave status
         if self.wave_manager.current_wave > 0:
             # Wave number and enemies remaining
@@ -483,13 +538,13 @@ class GameScene(Scene):
                 wave_text = f"Wave {self.wave_manager.current_wave}"
                 text_color = (255, 255, 255)  # White for normal waves
 
-            self.draw_text(wave_text, 28, text_color, display_width // 2, 15, align="center")
+            self.draw_text(wave_text, 28, text_color, self._hud_center_x, 15, align="center")
 
             # Enemies remaining
             if self.wave_in_progress:
                 enemies_text = f"Enemies: {self.wave_manager.enemies_remaining}"
                 self.draw_text(
-                    enemies_text, 20, (200, 200, 200), display_width // 2, 45, align="center"
+                    enemies_text, 20, (200, 200, 200), self._hud_center_x, 45, align="center"
                 )
 
     def draw_text(self, text, size, color, x, y, align="left", alpha=255):
@@ -504,12 +559,19 @@ class GameScene(Scene):
             align: Text alignment ('left', 'center', 'right')
             alpha: Transparency (0-255)
         """
-        font = pygame.font.Font(None, size)
-        text_surface = font.render(text, True, color)
-
-        # Apply alpha if needed
-        if alpha < 255:
-            text_surface.set_alpha(alpha)
+        key = (text, size, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            font = self._font_cache.get(size)
+            if font is None:
+                font = self._font_cache[size] = pygame.font.Font(None, size)
+            if len(self._text_cache) >= _TEXT_CACHE_LIMIT:
+                # Changing values (score, health, ...) keep adding entries; start over
+                self._text_cache.clear()
+            text_surface = self._text_cache[key] = font.render(text, True, color)
+
+        # Cached surfaces are shared between calls, so always set the alpha explicitly
+        text_surface.set_alpha(alpha)
 
         text_rect = text_surface.get_rect()
         if align == "center":
@@ -553,11 +615,16 @@ class GameScene(Scene):
         for group in [
             self.all_sprites,
             self.enemy_group,
+            self.ranged_enemies,
+            self.melee_enemies,
             self.projectile_group,
             self.powerup_group,
         ]:
             if group:  # Simply check if the group exists
                 group.empty()
+        self._separation_grid.clear()
+        # Pooled projectiles belong to this session; don't carry them into the next one
+        Projectile.clear_pool()
 
         # Reset camera
         if self.camera:
@@ -573,56 +640,69 @@ class GameScene(Scene):
 
     def _handle_collisions(self):
         """Manage all collision interactions."""
+        player = self.player
+        collision_system = self.collision_system
+        particle_system = self.particle_system
+        projectile_group = self.projectile_group
+        enemy_group = self.enemy_group
+        powerup_group = self.powerup_group
+
         # Projectiles vs Enemies
-        projectile_hits = self.collision_system.check_projectile_enemy_collisions(
-            self.projectile_group, self.enemy_group
-        )
-        for projectile, enemies in projectile_hits.items():
-            pos = projectile.rect.center
-            for enemy in enemies:
-                self.particle_system.create_particles(pos, "hit")
-                if handle_projectile_enemy_collision(projectile, enemy):
-                    self.play_sound("enemy_hit")
-                    self.handle_enemy_death(enemy)
+        if projectile_group and enemy_group:
+            projectile_hits = collision_system.check_projectile_enemy_collisions(
+                projectile_group, enemy_group
+            )
+            # Hit bursts for the whole frame are created together after the loop
+            hit_positions = []
+            for projectile, enemies in projectile_hits.items():
+                pos = projectile.rect.center
+                for enemy in enemies:
+                    # Another projectile may already have killed this enemy this frame;
+                    # handle_enemy_death is the single death path and must run only once,
+                    # but the projectile still hit and is used up
+                    if not enemy.alive():
+                        projectile.kill()
+                        continue
+                    hit_positions.append(pos)
+                    if handle_projectile_enemy_collision(projectile, enemy):
+                        self.play_sound("enemy_hit")
+                        self.handle_enemy_death(enemy)
+            particle_system.create_particles_batch(hit_positions, "hit")
 
         # Enemy Projectiles vs Player
-        if not self.player.invincible:
-            projectile_hits = self.collision_system.check_enemy_projectile_player_collision(
-                self.player, self.projectile_group
+        if projectile_group and not player.invincible:
+            projectile_hits = collision_system.check_enemy_projectile_player_collision(
+                player, projectile_group
             )
             for projectile in projectile_hits:
-                self.particle_system.create_particles(projectile.rect.center, "hit")
-                if handle_enemy_projectile_player_collision(self.player, projectile):
+                particle_system.create_particles(projectile.rect.center, "hit")
+                if handle_enemy_projectile_player_collision(player, projectile):
                     self.play_sound("player_hit")
                     if self.camera:
                         self.camera.start_screen_shake(
-                            config.get("effects", "screen_shake", "duration", default=300),
-                            config.get("effects", "screen_shake", "intensity", default=15),
+                            self.screen_shake_duration, self.screen_shake_intensity
                         )
 
         # Player vs Enemies
-        if not self.player.invincible:
-            enemy_hits = self.collision_system.check_player_enemy_collisions(
-                self.player, self.enemy_group
-            )
+        if enemy_group and not player.invincible:
+            enemy_hits = collision_system.check_player_enemy_collisions(player, enemy_group)
             for enemy in enemy_hits:
-                if handle_player_enemy_collision(self.player, enemy):
+                if handle_player_enemy_collision(player, enemy):
                     self.play_sound("player_hit")
                     if self.camera:
                         self.camera.start_screen_shake(
-                            config.get("effects", "screen_shake", "duration", default=300),
-                            config.get("effects", "screen_shake", "intensity", default=15) * 1.5,
+                            self.screen_shake_duration, self.screen_shake_intensity * 1.5
                         )
 
         # Player vs Powerups
-        powerup_hits = self.collision_system.check_player_powerup_collisions(
-            self.player, self.powerup_group
-        )
+        if not powerup_group:
+            return
+        powerup_hits = collision_system.check_player_powerup_collisions(player, powerup_group)
         for powerup in powerup_hits:
             if powerup.active:
-                self.particle_system.create_particles(powerup.rect.center, "powerup")
+                particle_system.create_particles(powerup.rect.center, "powerup")
                 self.play_sound("powerup_collect")
-                if handle_player_powerup_collision(self.player, powerup):
+                if handle_player_powerup_collision(player, powerup):
                     powerup.kill()
                     self.powerups_collected += 1
                     self.score_manager.powerup_collected()
@@ -634,12 +714,12 @@ class GameScene(Scene):
         self.enemies_killed += 1
         self.score_manager.enemy_defeated()
         self.particle_system.create_particles(pos, "death")
-        if random.random() < 0.25:
+        if random.random() < self.powerup_drop_chance:
             self.drop_powerup(pos)
 
     def drop_powerup(self, position):
         """Spawn a random powerup at the given position."""
-        powerup_type = random.choice(["health", "shield", "weapon", "speed", "damage"])
+        powerup_type = random.choice(_POWERUP_TYPES)
         powerup = Powerup(position, powerup_type)
         self.powerup_group.add(powerup)
         self.all_sprites.add(powerup)
@@ -647,18 +727,31 @@ class GameScene(Scene):
 
     def render(self):
         """Render all game elements to the screen."""
-        self.screen.fill(pygame.Color(config.get("screen", "background_color", default="#222222")))
+        self.screen.fill(self.background_color)
         if self.map_renderer and self.camera:
             self.map_renderer.render(self.screen, self.camera)
-        (
-            self.all_sprites.draw(self.screen)
-            if not self.camera
-            else [
-                self.screen.blit(sprite.image, self.camera.apply(sprite))
-                for sprite in self.all_sprites
-            ]
-        )
-        if self.camera:
-            self.particle_system.set_camera_offset(self.camera.get_offset())
-        self.particle_system.draw(self.screen)
+        if not self.camera:
+            # Group.draw also records every sprite's dirty rect, which this full redraw never uses
+            self.screen.blits(
+                [(sprite.image, sprite.rect) for sprite in self.all_sprites], doreturn=False
+            )
+        else:
+            offset_x, offset_y = self.camera.get_offset()
+            # Only draw sprites that overlap the visible part of the map, in one batched call
+            view_rect = pygame.Rect(
+                -offset_x, -offset_y, self.camera.screen_width, self.camera.screen_height
+            )
+            self.screen.blits(
+                [
+                    (sprite.image, sprite.rect.move(offset_x, offset_y))
+                    for sprite in self.all_sprites
+                    if view_rect.colliderect(sprite.rect)
+                ],
+                doreturn=False,
+            )
+        # Quiet frames have no particles to position or draw
+        if len(self.particle_system):
+            if self.camera:
+                self.particle_system.set_camera_offset((offset_x, offset_y))
+            self.particle_system.draw(self.screen)
         self._render_ui()
@@ -12,6 +12,7 @@ class Scene:
         self.screen = pygame.display.get_surface()
         self.clock = pygame.time.Clock()
         self.scene_manager = None  # Will be set by SceneManager
+        self.full_redraw = True  # Set by SceneManager whenever the scene becomes active
         self.sound_manager = game_sound_manager
         self.asset_manager = game_asset_manager
 
@@ -47,7 +48,12 @@ class Scene:
         pass
 
     def render(self):
-        """Render the scene. To be overridden by subclasses."""
+        """Render the scene. To be overridden by subclasses.
+
+        Returns:
+            Optional list of dirty rects to push to the display; None means the
+            whole screen changed and should be flipped.
+        """
         pass
 
     def switch_to_scene(self, scene_name):
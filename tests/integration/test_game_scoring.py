@@ -4,6 +4,7 @@ from scenes.game_scene import GameScene
 from managers.score_manager import ScoreManager
 from objects.enemy import Enemy
 from objects.powerup import Powerup
+from objects.projectile import Projectile
 
 
 @pytest.fixture
@@ -83,3 +84,26 @@ class TestGameScoring:
         # Verify high score is loaded
         assert loaded_score == high_score
         load_mock.assert_called_once()
+
+    def test_enemy_hit_by_two_projectiles_dies_once(self, game_scene):
+        """Test that an enemy hit by several projectiles in one frame is only counted once."""
+        enemy = Enemy((100, 100))
+        enemy.health = 1
+        game_scene.enemy_group.add(enemy)
+        game_scene.all_sprites.add(enemy)
+        projectiles = [Projectile(enemy.rect.center, (0, 0), damage=5) for _ in range(2)]
+        game_scene.projectile_group.add(projectiles)
+
+        game_scene.collision_system.update(
+            game_scene.projectile_group,
+            game_scene.enemy_group,
+            game_scene.player,
+            game_scene.powerup_group,
+        )
+        game_scene._handle_collisions()
+
+        assert not enemy.alive()
+        assert game_scene.enemies_killed == 1
+        # The second projectile is still used up by the hit, without dealing damage
+        assert not game_scene.projectile_group
+        assert not any(projectile.active for projectile in projectiles)
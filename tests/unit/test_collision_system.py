@@ -274,3 +274,47 @@ class TestCollisionSystem:
             assert len(player_collisions) <= 3
 
             logger.info(f"Spatial partitioning efficiency test passed for {system_name}")
+
+    def test_spatial_hash_incremental_update(self, setup_collision_system):
+        """Test that the spatial hash follows moved sprites and drops removed ones."""
+        collision_system = setup_collision_system["spatial_hash_system"]
+        player = setup_collision_system["player"]
+        enemy_group = setup_collision_system["enemy_group"]
+        projectile_group = setup_collision_system["projectile_group"]
+        powerup_group = setup_collision_system["powerup_group"]
+
+        collision_system.update(projectile_group, enemy_group, player, powerup_group)
+
+        # Move an enemy onto the player and remove another one entirely
+        enemies = list(enemy_group)
+        moved_enemy = enemies[0]
+        moved_enemy.rect.center = player.rect.center
+        for enemy in enemies[1:]:
+            enemy_group.remove(enemy)
+        collision_system.update(projectile_group, enemy_group, player, powerup_group)
+
+        grid = collision_system.spatial_structure.grid
+        tracked = {sprite for cell in grid.values() for sprite in cell}
+        assert moved_enemy in tracked
+        assert not tracked & set(enemies[1:])
+        assert moved_enemy in collision_system.check_player_enemy_collisions(player, enemy_group)
+
+    def test_projectile_enemy_collisions_many_pairs(self, setup_collision_system):
+        """Test projectile-enemy detection when there are enough pairs to use the broad phase."""
+        enemies = [MockSprite((i % 5) * 150, (i // 5) * 140, 15, 15) for i in range(20)]
+        projectiles = [MockSprite(5 + i * 30, 580, 5, 5) for i in range(20)]
+        target = enemies[7]
+        projectiles[0].rect.topleft = target.rect.topleft
+        enemy_group = pygame.sprite.Group(enemies)
+        projectile_group = pygame.sprite.Group(projectiles)
+
+        for system_name in ["quadtree_system", "spatial_hash_system"]:
+            collision_system = setup_collision_system[system_name]
+            player = setup_collision_system["player"]
+            collision_system.update(projectile_group, enemy_group, player, pygame.sprite.Group())
+
+            collisions = collision_system.check_projectile_enemy_collisions(
+                projectile_group, enemy_group
+            )
+
+            assert collisions == {projectiles[0]: [target]}
@@ -0,0 +1,103 @@
+"""Tests for the GameOverScene hit testing and dirty-rect rendering."""
+
+import pytest
+import pygame
+from managers import config, game_asset_manager
+from managers.asset_manager import AssetManager
+from managers.scene_manager import SceneManager
+from scenes.game_over import GameOverScene
+
+
+def linear_button_at(scene, pos):
+    """Reference hit test: the first button whose rect contains pos."""
+    for i, rect in enumerate(scene.button_rects):
+        if rect.collidepoint(pos):
+            return i
+    return None
+
+
+class TestGameOverScene:
+    """Tests for the GameOverScene class."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_pygame(self, monkeypatch):
+        """Give the scene a display and live fonts.
+
+        Earlier test classes call pygame.quit(), which frees the fonts the shared asset
+        manager loaded at import; rendering text with them would crash.
+        """
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        monkeypatch.setattr(game_asset_manager, "fonts", AssetManager().fonts)
+
+    @pytest.fixture
+    def scene(self):
+        """Create a game over scene with its UI loaded."""
+        scene = GameOverScene()
+        scene._ensure_ui_loaded()
+        return scene
+
+    @pytest.fixture
+    def tall_button_config(self, monkeypatch):
+        """Configure buttons that are taller than their spacing, so neighbours overlap."""
+        original_get = config.get
+
+        def get(*keys, default=None):
+            if keys == ("ui", "game_over"):
+                return {"buttons": {"height": 80, "spacing": 50}}
+            return original_get(*keys, default=default)
+
+        monkeypatch.setattr(config, "get", get)
+
+    def assert_matches_linear_scan(self, scene):
+        """Check _button_at against a linear scan over a grid covering the buttons."""
+        area = scene._buttons_bbox.inflate(20, 20)
+        for x in range(area.left, area.right, 7):
+            for y in range(area.top, area.bottom):
+                assert scene._button_at((x, y)) == linear_button_at(scene, (x, y)), (x, y)
+
+    def test_button_at_matches_linear_scan(self, scene):
+        """Test that _button_at agrees with a linear collidepoint scan."""
+        self.assert_matches_linear_scan(scene)
+
+    def test_button_at_matches_linear_scan_with_overlap(self, tall_button_config):
+        """Test that the topmost button wins where taller-than-spacing buttons overlap."""
+        scene = GameOverScene()
+        scene._ensure_ui_loaded()
+
+        first, second = scene.button_rects[:2]
+        assert first.colliderect(second)
+        self.assert_matches_linear_scan(scene)
+
+    def test_full_redraw_returns_none(self, scene):
+        """Test that a full redraw asks for the whole screen to be flipped."""
+        scene.full_redraw = True
+
+        assert scene.render() is None
+        assert not scene.full_redraw
+
+    def test_unchanged_selection_returns_no_rects(self, scene):
+        """Test that nothing is redrawn when the selection hasn't changed."""
+        scene.render()
+
+        assert scene.render() == []
+
+    def test_selection_change_returns_both_button_rects(self, scene):
+        """Test that moving the selection redraws only the old and new buttons."""
+        scene.render()
+        scene.selected_option = 2
+
+        assert scene.render() == [scene.button_rects[0], scene.button_rects[2]]
+        assert scene.render() == []
+
+    def test_set_active_scene_requests_full_redraw(self, scene):
+        """Test that becoming the active scene forces the next frame to be drawn in full."""
+        manager = SceneManager()
+        manager.add_scene("game_over", scene)
+        scene.render()
+        assert not scene.full_redraw
+
+        manager.set_active_scene("game_over")
+
+        assert scene.full_redraw
+        assert scene.render() is None
@@ -0,0 +1,69 @@
+"""Tests for the Projectile class and its pool."""
+
+import pytest
+import pygame
+from objects import Projectile
+
+
+class TestProjectile:
+    """Tests for the Projectile class."""
+
+    @pytest.fixture(autouse=True)
+    def empty_pool(self):
+        """Start and finish each test with an empty projectile pool."""
+        Projectile.clear_pool()
+        yield
+        Projectile.clear_pool()
+
+    def test_acquire_reuses_killed_projectile(self):
+        """Test that acquire() hands back a projectile that was killed."""
+        projectile = Projectile.acquire((100, 100), (5, 0))
+        group = pygame.sprite.Group(projectile)
+        projectile.kill()
+
+        assert not group
+        assert Projectile.acquire((200, 200), (0, 5)) is projectile
+        assert Projectile.acquire((200, 200), (0, 5)) is not projectile
+
+    def test_double_kill_pools_once(self):
+        """Test that killing a projectile twice only adds it to the pool once."""
+        projectile = Projectile((100, 100), (5, 0))
+        projectile.kill()
+        projectile.kill()
+
+        assert Projectile._pool == [projectile]
+
+    def test_reset_restores_state(self):
+        """Test that a reused projectile carries nothing over from its previous shot."""
+        projectile = Projectile((100, 100), (5, 0), damage=50, is_crit=True)
+        old_id = projectile.id
+        projectile.update()
+        projectile.kill()
+
+        reused = Projectile.acquire((300, 250), (0, -4), is_enemy_projectile=True)
+
+        assert reused is projectile
+        assert reused.id != old_id
+        assert reused.active
+        assert reused.damage == Projectile.DEFAULT_DAMAGE
+        assert reused.color == Projectile.ENEMY_COLOR
+        assert reused.image.get_at((0, 0))[:3] == Projectile.ENEMY_COLOR
+        assert reused.is_enemy_projectile
+        assert reused.position == (300.0, 250.0)
+        assert reused.rect.center == (300, 250)
+        assert reused.velocity == (0, -4)
+
+        reused.update()
+        assert reused.position == (300.0, 246.0)
+
+    def test_reset_clears_mask_when_image_changes(self, monkeypatch):
+        """Test that a new image size drops the cached collision mask."""
+        projectile = Projectile((100, 100), (5, 0))
+        projectile.mask = pygame.mask.from_surface(projectile.image)
+        projectile.kill()
+
+        monkeypatch.setattr(Projectile, "WIDTH", Projectile.WIDTH + 4)
+        reused = Projectile.acquire((100, 100), (5, 0))
+
+        assert reused.image.get_width() == Projectile.WIDTH
+        assert reused.mask is None
@@ -1,11 +1,15 @@
 """Handle collisions between game objects."""
 
+import itertools
 import pygame
 from utils.logger import GameLogger
 
 # Get a logger for the collision handler module
 logger = GameLogger.get_logger("collision_handler")
 
+# Below this many projectile-enemy pairs the broad phase costs more than it saves
+_BRUTE_FORCE_PAIR_LIMIT = 256
+
 
 def handle_player_enemy_collision(player, enemy):
     """Handle collision between player and enemy.
@@ -297,72 +301,141 @@ class SpatialHashGrid:
             cell_size: Size of each grid cell (smaller = more precise but more memory)
         """
         self.cell_size = cell_size
+        # Power-of-two cell sizes (the default 64 included) can be hashed with a bit shift
+        self._cell_shift = (
+            cell_size.bit_length() - 1
+            if isinstance(cell_size, int) and cell_size > 0 and cell_size & (cell_size - 1) == 0
+            else None
+        )
         self.width = width
         self.height = height
         self.grid = {}
+        # Cell range (start_x, end_x, start_y, end_y) each tracked sprite was last hashed into
+        self._sprite_cells = {}
 
     def clear(self):
         """Clear the grid."""
         self.grid.clear()
+        self._sprite_cells.clear()
 
-    def _get_cell_key(self, x, y):
+    def _get_cell_range(self, rect):
         """
-        Get the key for a cell at the given coordinates.
+        Get the range of cells a rectangle occupies.
 
         Args:
-            x: X coordinate
-            y: Y coordinate
+            rect: pygame.Rect object
 
         Returns:
-            tuple: (cell_x, cell_y) key
+            tuple: (start_x, end_x, start_y, end_y) cell indices, inclusive
         """
-        return (x // self.cell_size, y // self.cell_size)
+        shift = self._cell_shift
+        if shift is not None:
+            return (
+                rect.left >> shift,
+                rect.right >> shift,
+                rect.top >> shift,
+                rect.bottom >> shift,
+            )
+        cell_size = self.cell_size
+        return (
+            rect.left // cell_size,
+            rect.right // cell_size,
+            rect.top // cell_size,
+            rect.bottom // cell_size,
+        )
+
+    def _add_to_cells(self, sprite, cell_range):
+        """Add a sprite to every cell in cell_range."""
+        start_x, end_x, start_y, end_y = cell_range
+        grid = self.grid
+        for x in range(start_x, end_x + 1):
+            for y in range(start_y, end_y + 1):
+                cell = grid.get((x, y))
+                if cell is None:
+                    grid[(x, y)] = [sprite]
+                else:
+                    cell.append(sprite)
+
+    def _remove_from_cells(self, sprite, cell_range):
+        """Remove a sprite from every cell in cell_range, dropping cells that become empty."""
+        start_x, end_x, start_y, end_y = cell_range
+        grid = self.grid
+        for x in range(start_x, end_x + 1):
+            for y in range(start_y, end_y + 1):
+                cell = grid.get((x, y))
+                if cell is not None:
+                    cell.remove(sprite)
+                    if not cell:
+                        del grid[(x, y)]
 
-    def _get_cells_for_rect(self, rect):
+    def insert(self, sprite):
         """
-        Get all cell keys that a rectangle occupies.
+        Insert a sprite into the grid, or move it if it is already there.
+
+        A sprite that still occupies the same cells as when it was last inserted is left alone.
 
         Args:
-            rect: pygame.Rect object
+            sprite: A pygame.sprite.Sprite object with a rect attribute
+        """
+        cell_range = self._get_cell_range(sprite.rect)
+        old_range = self._sprite_cells.get(sprite)
+        if cell_range == old_range:
+            return
+        if old_range is not None:
+            self._remove_from_cells(sprite, old_range)
+        self._add_to_cells(sprite, cell_range)
+        self._sprite_cells[sprite] = cell_range
+
+    def remove(self, sprite):
+        """
+        Remove a sprite from the grid.
 
-        Returns:
-            list: List of cell keys
+        Args:
+            sprite: A sprite previously added with insert()
         """
-        left = rect.left
-        right = rect.right
-        top = rect.top
-        bottom = rect.bottom
+        old_range = self._sprite_cells.pop(sprite, None)
+        if old_range is not None:
+            self._remove_from_cells(sprite, old_range)
 
-        # Calculate the cell ranges
-        start_x = left // self.cell_size
-        end_x = right // self.cell_size
-        start_y = top // self.cell_size
-        end_y = bottom // self.cell_size
+    def sync(self, sprites):
+        """
+        Bring the grid up to date with the given sprites.
 
-        # Generate all cell keys
-        cell_keys = []
-        for x in range(start_x, end_x + 1):
-            for y in range(start_y, end_y + 1):
-                cell_keys.append((x, y))
+        Only sprites that moved into a different set of cells are re-hashed, and sprites
+        that are no longer present are removed.
+
+        Args:
+            sprites: Iterable of every sprite that should be in the grid
+        """
+        current = set()
+        for sprite in sprites:
+            current.add(sprite)
+            self.insert(sprite)
 
-        return cell_keys
+        for sprite in self._sprite_cells.keys() - current:
+            self.remove(sprite)
 
-    def insert(self, sprite):
+    def query(self, rect):
         """
-        Insert a sprite into the grid.
+        Retrieve all sprites in the cells that a rectangle overlaps.
 
         Args:
-            sprite: A pygame.sprite.Sprite object with a rect attribute
-        """
-        # Get all cells the sprite occupies
-        cell_keys = self._get_cells_for_rect(sprite.rect)
+            rect: pygame.Rect area to search
 
-        # Add the sprite to each cell
-        for key in cell_keys:
-            if key not in self.grid:
-                self.grid[key] = []
+        Returns:
+            set: Sprites whose cells overlap the rectangle
+        """
+        start_x, end_x, start_y, end_y = self._get_cell_range(rect)
+        grid_get = self.grid.get
 
-            self.grid[key].append(sprite)
+        # Create a set to avoid duplicate sprites; each occupied cell is merged in one C call
+        found = set()
+        for x in range(start_x, end_x + 1):
+            for y in range(start_y, end_y + 1):
+                cell = grid_get((x, y))
+                if cell:
+                    found.update(cell)
+        return found
 
     def retrieve(self, sprite):
         """
@@ -374,19 +447,10 @@ class SpatialHashGrid:
         Returns:
             list: List of potential collisions (without duplicates)
         """
-        # Get all cells the sprite occupies
-        cell_keys = self._get_cells_for_rect(sprite.rect)
+        potential_collisions = self.query(sprite.rect)
 
-        # Create a set to avoid duplicate sprites
-        potential_collisions = set()
-
-        # Add all sprites from each occupied cell
-        for key in cell_keys:
-            if key in self.grid:
-                for potential_sprite in self.grid[key]:
-                    # Don't add the sprite itself
-                    if potential_sprite != sprite:
-                        potential_collisions.add(potential_sprite)
+        # Don't add the sprite itself
+        potential_collisions.discard(sprite)
 
         return list(potential_collisions)
 
@@ -434,6 +498,13 @@ class CollisionSystem:
             player: Player sprite
             powerup_group: Group of powerup sprites
         """
+        if self.algorithm == self.SPATIAL_HASH:
+            # The grid is updated in place; only sprites that changed cells are re-hashed
+            self.spatial_structure.sync(
+                itertools.chain(projectile_group, enemy_group, powerup_group, (player,))
+            )
+            return
+
         # Clear the previous state
         self.spatial_structure.clear()
 
@@ -465,15 +536,21 @@ class CollisionSystem:
 
         # Only consider player projectiles (not enemy projectiles)
         player_projectiles = [
-            p
-            for p in projectile_group
-            if not hasattr(p, "is_enemy_projectile") or not p.is_enemy_projectile
+            p for p in projectile_group if not getattr(p, "is_enemy_projectile", False)
         ]
 
+        # With only a few pairs, checking every enemy is cheaper than querying the structure
+        if len(player_projectiles) * len(enemy_group) < _BRUTE_FORCE_PAIR_LIMIT:
+            all_enemies = enemy_group.sprites()
+        else:
+            all_enemies = None
+
         # Retrieve enemies for each projectile
         for projectile in player_projectiles:
             # Get potential collisions
-            if self.algorithm == self.QUADTREE:
+            if all_enemies is not None:
+                potential_enemies = all_enemies
+            elif self.algorithm == self.QUADTREE:
                 potential_enemies = []
                 self.spatial_structure.retrieve(potential_enemies, projectile)
                 # Filter to only include enemies
@@ -513,12 +590,12 @@ class CollisionSystem:
         if hasattr(player, "invincible") and player.invincible:
             return []
 
-        # Only consider enemy projectiles
-        enemy_projectiles = [
-            p
-            for p in projectile_group
-            if hasattr(p, "is_enemy_projectile") and p.is_enemy_projectile
-        ]
+        # Only consider enemy projectiles; a set makes the candidate filter O(1) per sprite
+        enemy_projectiles = {
+            p for p in projectile_group if getattr(p, "is_enemy_projectile", False)
+        }
+        if not enemy_projectiles:
+            return []
 
         # Get potential collisions
         if self.algorithm == self.QUADTREE:
@@ -657,15 +734,20 @@ def mask_collision(sprite1, sprite2):
     Returns:
         True if there's a mask collision, False otherwise
     """
-    # Create masks for both sprites (if they don't already have them)
-    if not hasattr(sprite1, "mask") or sprite1.mask is None:
-        sprite1.mask = pygame.mask.from_surface(sprite1.image)
+    rect1 = sprite1.rect
+    rect2 = sprite2.rect
+    # Broad-phase candidates often only share a cell; skip the mask test when rects miss
+    if not rect1.colliderect(rect2):
+        return False
 
-    if not hasattr(sprite2, "mask") or sprite2.mask is None:
-        sprite2.mask = pygame.mask.from_surface(sprite2.image)
+    # Create masks for both sprites (if they don't already have them)
+    mask1 = getattr(sprite1, "mask", None)
+    if mask1 is None:
+        mask1 = sprite1.mask = pygame.mask.from_surface(sprite1.image)
 
-    # Calculate the offset between the two sprites
-    offset = (sprite2.rect.x - sprite1.rect.x, sprite2.rect.y - sprite1.rect.y)
+    mask2 = getattr(sprite2, "mask", None)
+    if mask2 is None:
+        mask2 = sprite2.mask = pygame.mask.from_surface(sprite2.image)
 
-    # Check if the masks overlap at the given offset
-    return sprite1.mask.overlap(sprite2.mask, offset) is not None
+    # Check if the masks overlap at the offset between the two sprites
+    return mask1.overlap(mask2, (rect2.x - rect1.x, rect2.y - rect1.y)) is not None